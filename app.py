@@ -4,10 +4,11 @@
 Desktop-Pet with user-customisable themes (macOS).
 """
 import sys, os, json, subprocess, shutil
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, timedelta
 import requests
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 
 from PyQt5.QtWidgets import (
     QApplication, QLabel, QWidget, QMenu, QMessageBox,
@@ -26,6 +27,7 @@ DEFAULT_THEME_NAME  = "主题一"
 DEFAULT_CITY        = "杭州"
 DEFAULT_MAIN_GIF    = "mostima.gif"   # 日常
 DEFAULT_RELAX_GIF   = "relax.gif"     # 悬停
+THEME_CACHE_SIZE    = 3               # 最近使用的主题动画常驻数量（含当前主题）
 
 # ---------- 高德 API 端点 ----------
 GEOCODE_URL = "https://restapi.amap.com/v3/geocode/geo"
@@ -71,6 +73,58 @@ class WeatherThread(QThread):
             self.error.emit(str(e))
 
 
+# ----------- 主题动画缓存 -----------
+class MovieCache:
+    """按 (日常, 悬停) GIF 路径缓存 QMovie 对，LRU 淘汰，最多保留 capacity 个主题"""
+    def __init__(self, owner: QWidget, on_frame, capacity: int = THEME_CACHE_SIZE):
+        self.owner    = owner
+        self.on_frame = on_frame
+        self.capacity = max(1, capacity)
+        self._movies: "OrderedDict[Tuple[str, str], Tuple[QMovie, QMovie]]" = OrderedDict()
+        self._current: Optional[Tuple[str, str]] = None   # 最近一次 get 返回的（正在使用）
+
+    def __len__(self):
+        return len(self._movies)
+
+    def get(self, main_path: str, relax_path: str) -> Tuple[QMovie, QMovie]:
+        """取出（或新建）一对动画，并标记为最近使用"""
+        key = (main_path, relax_path)
+        self._current = key
+        if key in self._movies:
+            self._movies.move_to_end(key)
+            return self._movies[key]
+
+        pair = (self._create(main_path), self._create(relax_path))
+        self._movies[key] = pair
+        while len(self._movies) > self.capacity:
+            _, old = self._movies.popitem(last=False)
+            self._release(old)
+        return pair
+
+    def discard(self, main_path: str, relax_path: str):
+        """主题被删除/改名时释放对应动画；正在使用的那对不会被释放"""
+        key = (main_path, relax_path)
+        if key == self._current:
+            return
+        pair = self._movies.pop(key, None)
+        if pair:
+            self._release(pair)
+
+    def _create(self, path: str) -> QMovie:
+        movie = QMovie(path, parent=self.owner)
+        movie.frameChanged.connect(self.on_frame)   # 每个对象只连接一次
+        return movie
+
+    def _release(self, pair: Tuple[QMovie, QMovie]):
+        for movie in pair:
+            movie.stop()
+            try:
+                movie.frameChanged.disconnect(self.on_frame)
+            except TypeError:
+                pass
+            movie.deleteLater()
+
+
 # ----------- 日程对话框 -----------
 class EventDialog(QDialog):
     """日期 + 时间 + 持续时长 + 标题 选择对话框"""
@@ -193,7 +247,8 @@ class DesktopPet(QWidget):
         self.label.resize(200, 200)
 
         # —— 动画 —— #
-        self.movie_main  = None    # 会在 set_theme 中创建
+        self.movie_cache = MovieCache(self, self.update_frame)
+        self.movie_main  = None    # 会在 set_theme 中从缓存取出
         self.movie_relax = None
         self.movie       = None
         self.set_theme(self.current_theme)   # 初始主题
@@ -244,15 +299,13 @@ class DesktopPet(QWidget):
 
         main_path, relax_path = self.themes[theme_name]
 
-        # 停止旧动画
-        if self.movie_main:  self.movie_main.stop()
-        if self.movie_relax: self.movie_relax.stop()
+        # 停止旧动画（仍留在缓存中，切回时可直接复用）
+        if self.movie:
+            self.movie.stop()
+            self.movie = None
 
-        # 创建新动画
-        self.movie_main  = QMovie(main_path)
-        self.movie_relax = QMovie(relax_path)
-        self.movie_main.frameChanged.connect(self.update_frame)
-        self.movie_relax.frameChanged.connect(self.update_frame)
+        # 从缓存取动画，超出上限的旧主题会被释放
+        self.movie_main, self.movie_relax = self.movie_cache.get(main_path, relax_path)
 
         # 切到主动画
         self.switch_movie(self.movie_main)
@@ -333,7 +386,10 @@ class DesktopPet(QWidget):
         if yes != QMessageBox.Yes:
             return
 
-        # —— 删除磁盘文件 —— #
+        # —— 释放动画 & 删除磁盘文件 —— #
+        if self.current_theme == name:
+            self.set_theme(DEFAULT_THEME_NAME)
+        self.movie_cache.discard(*self.themes[name])
         for p in self.themes.get(name, []):
             try:
                 Path(p).unlink(missing_ok=True)
@@ -343,9 +399,6 @@ class DesktopPet(QWidget):
         # —— 从字典里移除并写配置 —— #
         self.themes.pop(name, None)
         self.config["themes"] = self.themes
-        # 若删除的是当前主题才切回默认
-        if self.current_theme == name:
-            self.set_theme(DEFAULT_THEME_NAME)
         self._write_config(self.config)
 
         QMessageBox.information(self, "删除完成", f"主题「{name}」已删除")
@@ -365,7 +418,8 @@ class DesktopPet(QWidget):
             return
 
         # 改文件名，保持磁盘整洁
-        old_main, old_relax = map(Path, self.themes[old])
+        old_paths = self.themes[old]
+        old_main, old_relax = map(Path, old_paths)
         new_main  = old_main.with_name(f"{new}_main.gif")
         new_relax = old_relax.with_name(f"{new}_relax.gif")
         try:
@@ -377,10 +431,10 @@ class DesktopPet(QWidget):
 
         self.themes[new] = [str(new_main), str(new_relax)]
         self.themes.pop(old)
-        self.current_theme           = new
-        self.config["themes"]        = self.themes
-        self.config["current_theme"] = new
-        self._write_config(self.config)
+        self.config["themes"] = self.themes
+        # 文件路径已变，按新路径重新加载动画，再释放旧的
+        self.set_theme(new)
+        self.movie_cache.discard(*old_paths)
         QMessageBox.information(self, "重命名成功", f"已将主题「{old}」重命名为「{new}」")
 
     # ---------- 天气 ----------
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+主题切换浸泡测试：无界面反复切换主题，检查存活 QMovie 数量、
+frameChanged 连接数以及 RSS 是否趋于平稳（RSS 检查仅在有 /proc 的 Linux 上进行）。
+
+    QT_QPA_PLATFORM=offscreen python bench_theme_switch.py [切换次数]
+"""
+import sys, os, gc, tempfile, resource
+from typing import List, Optional
+from pathlib import Path
+
+# —— 隔离配置目录 & 无界面运行（须在导入 app 之前）—— #
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["HOME"] = tempfile.mkdtemp(prefix="desktop_pet_bench_")
+ROOT = Path(__file__).resolve().parent
+os.chdir(ROOT)
+sys.path.insert(0, str(ROOT))
+
+from PyQt5 import sip
+from PyQt5.QtCore import QCoreApplication, QEvent
+from PyQt5.QtGui import QMovie
+from PyQt5.QtWidgets import QApplication
+
+import app
+
+GIFS = ["mostima.gif", "relax.gif", "sit.gif", "sleep.gif", "special.gif", "interact.gif"]
+RSS_TOLERANCE_KB = 4096     # 后半程允许的 RSS 增长
+
+
+def rss_kb() -> Optional[int]:
+    """当前常驻内存（KB），读 /proc；不可用时返回 None（峰值 RSS 不能反映平稳与否）"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize() // 1024
+    except OSError:
+        return None
+
+
+def live_movies() -> List[QMovie]:
+    """进程内所有未销毁的 QMovie，不论是否有 parent"""
+    gc.collect()
+    return [o for o in gc.get_objects() if isinstance(o, QMovie) and not sip.isdeleted(o)]
+
+
+def flush(qapp: QApplication):
+    """处理积压事件并执行 deleteLater"""
+    qapp.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    qapp = QApplication(sys.argv)
+    app.DesktopPet.fetch_weather = lambda self: None   # 不访问网络
+
+    pet = app.DesktopPet()
+    for i, main_gif in enumerate(GIFS):
+        pet.themes[f"bench{i}"] = [str(ROOT / main_gif), str(ROOT / GIFS[(i + 1) % len(GIFS)])]
+    names = list(pet.themes)
+
+    half_rss, max_movies, max_receivers = None, 0, 0
+    for n in range(rounds):
+        pet.set_theme(names[n % len(names)])
+        if n % 50 == 0:
+            flush(qapp)
+            movies = live_movies()
+            max_movies = max(max_movies, len(movies))
+            max_receivers = max([max_receivers] + [m.receivers(m.frameChanged) for m in movies])
+        if n == rounds // 2:
+            half_rss = rss_kb()
+    flush(qapp)
+
+    movies  = live_movies()
+    end_rss = rss_kb()
+    limit   = 2 * app.THEME_CACHE_SIZE
+    print(f"switches={rounds} themes={len(names)} cache={app.THEME_CACHE_SIZE}")
+    print(f"live QMovie={len(movies)} (peak {max_movies}, limit {limit})")
+    print(f"frameChanged receivers per movie: peak {max_receivers}")
+
+    assert max_movies <= limit, f"QMovie 数量超出上限：{max_movies} > {limit}"
+    for m in movies:
+        assert m.receivers(m.frameChanged) == 1, "frameChanged 连接数不为 1，疑似重复连接"
+
+    if end_rss is None or half_rss is None:
+        print("RSS: /proc 不可用，跳过平稳性检查")
+    else:
+        print(f"RSS half={half_rss} KB end={end_rss} KB growth={end_rss - half_rss} KB")
+        assert end_rss - half_rss <= RSS_TOLERANCE_KB, "RSS 未趋于平稳，疑似泄漏"
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()